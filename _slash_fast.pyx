@@ -0,0 +1,41 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled versions of the hot helpers in slash.py.
+
+Build in place with `python setup.py build_ext --inplace`. slash.py falls
+back to its pure-Python implementations when this module is not built.
+"""
+
+cdef object _MISSING = object()
+
+def bind_args(tuple args, dict kwargs, dict positions, tuple defaults, Py_ssize_t num_required):
+    """
+    Bind call arguments to a flat list in parameter order.
+
+    See slash._bind_args for the argument description.
+    """
+    cdef Py_ssize_t given = len(args)
+    cdef Py_ssize_t index
+    cdef list final
+    cdef object position
+
+    if given > num_required + len(defaults):
+        raise TypeError("too many positional arguments")
+    final = list(args)
+    if given < num_required:
+        final.extend([_MISSING] * (num_required - given))
+        final.extend(defaults)
+    else:
+        final.extend(defaults[given - num_required:])
+    for key, value in kwargs.items():
+        position = positions.get(key)
+        if position is None:
+            raise TypeError(f"got an unexpected keyword argument {key!r}")
+        index = position
+        if index < given:
+            raise TypeError(f"multiple values for argument {key!r}")
+        final[index] = value
+    for index in range(given, num_required):
+        if final[index] is _MISSING:
+            raise TypeError(f"missing a required argument: {list(positions)[index]!r}")
+    return final
@@ -0,0 +1,17 @@
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    # The compiled helpers are optional, slash.py works without them
+    ext_modules = []
+else:
+    ext_modules = cythonize(["_slash_fast.pyx"])
+
+setup(
+    name="easy_discord_slash",
+    py_modules=["slash"],
+    ext_modules=ext_modules,
+    install_requires=["discord.py"],
+    extras_require={"speed": ["discord.py[speed]"]},
+)
@@ -1,8 +1,214 @@
+"""
+Easy Discord Slash: decorators for discord.py slash and message commands.
+
+Running this module starts the example bot below. It uses uvloop (winloop
+on Windows) as the event loop when installed, which lowers the overhead
+of the asyncio I/O the bot spends most of its time in:
+
+    pip install uvloop    # or winloop on Windows
+
+See the README for running bots with `python -OO`.
+"""
+import asyncio
 import discord
 from discord.ext import commands
 from discord import app_commands
 import inspect
-from typing import Any, Callable, Dict, Optional, Type
+import logging
+import platform
+import types
+from typing import Callable, Dict, List, Optional, Type
+
+_log = logging.getLogger(__name__)
+
+# Marks a missing annotation or default, like inspect.Parameter.empty
+_EMPTY = object()
+SLASH_HELP_TMPL = "**{name}**\nType: Slash Command\nDescription: {desc}{args}"
+MSG_HELP_TMPL = "**{name}**\nType: Message Command{desc}{aliases}{args}"
+PARAM_HELP_TMPL = "\n- `{name}`: {type} ({default}){conv}"
+
+def _extract_params(func: Callable):
+    """
+    Read the parameters of a command callback.
+
+    Plain functions are read straight from their code object, which is
+    much cheaper than inspect.signature. Other callables go through
+    inspect.signature.
+
+    Args:
+        func: The command callback
+
+    Returns:
+        tuple: (names, annotations, defaults, num_required), or the
+        inspect.Signature of func if it takes positional-only, keyword-only,
+        *args or **kwargs parameters
+    """
+    if type(func) is not types.FunctionType or hasattr(func, "__wrapped__") or hasattr(func, "__signature__"):
+        sig = inspect.signature(func)
+        params = list(sig.parameters.values())
+        if any(param.kind is not inspect.Parameter.POSITIONAL_OR_KEYWORD for param in params):
+            return sig
+        names = tuple(param.name for param in params)
+        annotations = {param.name: param.annotation for param in params if param.annotation is not inspect.Parameter.empty}
+        defaults = tuple(param.default for param in params if param.default is not inspect.Parameter.empty)
+        return names, annotations, defaults, len(names) - len(defaults)
+
+    code = func.__code__
+    if code.co_flags & (inspect.CO_VARARGS | inspect.CO_VARKEYWORDS) or code.co_kwonlyargcount or code.co_posonlyargcount:
+        return inspect.signature(func)
+    names = code.co_varnames[:code.co_argcount]
+    defaults = func.__defaults__ or ()
+    return names, func.__annotations__, defaults, len(names) - len(defaults)
+
+def _iter_params(spec):
+    """
+    Iterate over the parameters of a command callback.
+
+    Args:
+        spec: The tuple returned by _extract_params, or an inspect.Signature
+
+    Yields:
+        tuple: (name, annotation, default), with _EMPTY for missing values
+    """
+    if isinstance(spec, inspect.Signature):
+        for param in spec.parameters.values():
+            annotation = _EMPTY if param.annotation is inspect.Parameter.empty else param.annotation
+            default = _EMPTY if param.default is inspect.Parameter.empty else param.default
+            yield param.name, annotation, default
+        return
+
+    names, annotations, defaults, num_required = spec
+    for index, name in enumerate(names):
+        default = defaults[index - num_required] if index >= num_required else _EMPTY
+        yield name, annotations.get(name, _EMPTY), default
+
+def _describe_params(spec) -> tuple:
+    """
+    Describe the arguments of a command callback for its help message.
+
+    Args:
+        spec: The parameters of the callback, see _extract_params
+
+    Returns:
+        tuple: (name, type_name, default_str, annotation) for each argument
+    """
+    params = list(_iter_params(spec))
+    if len(params) <= 1:  # Just ctx or interaction
+        return ()
+    return tuple(
+        (
+            name,
+            (getattr(annotation, "__name__", None) or str(annotation)) if annotation is not _EMPTY else 'Any',
+            "Required" if default is _EMPTY else f"Optional (default: {default})",
+            annotation,
+        )
+        for name, annotation, default in params
+        if name not in ('self', 'ctx', 'interaction')
+    )
+
+def _bind_args(args: tuple, kwargs: dict, positions: dict, defaults: tuple, num_required: int) -> list:
+    """
+    Bind call arguments to a flat list in parameter order.
+
+    Equivalent to inspect.Signature.bind followed by apply_defaults for
+    callables taking only positional-or-keyword parameters, without
+    allocating a BoundArguments object on every call.
+
+    Args:
+        args: Positional arguments, excluding the context
+        kwargs: Keyword arguments
+        positions: Mapping of parameter name to its index
+        defaults: Default values of the trailing optional parameters
+        num_required: Number of leading parameters without a default
+
+    Returns:
+        list: Argument values in parameter order
+    """
+    given = len(args)
+    if given > num_required + len(defaults):
+        raise TypeError("too many positional arguments")
+    final = list(args)
+    if given < num_required:
+        final.extend([_EMPTY] * (num_required - given))
+        final.extend(defaults)
+    else:
+        final.extend(defaults[given - num_required:])
+    for key, value in kwargs.items():
+        index = positions.get(key)
+        if index is None:
+            raise TypeError(f"got an unexpected keyword argument {key!r}")
+        if index < given:
+            raise TypeError(f"multiple values for argument {key!r}")
+        final[index] = value
+    for index in range(given, num_required):
+        if final[index] is _EMPTY:
+            raise TypeError(f"missing a required argument: {list(positions)[index]!r}")
+    return final
+
+async def _reply_err_interaction(handler: Optional[Callable], error: Exception, interaction: discord.Interaction):
+    """
+    Report an error raised by a slash command.
+
+    Args:
+        handler: The custom error handler, or None to reply with the error
+        error: The raised exception
+        interaction: The interaction the command was invoked with
+    """
+    if handler:
+        await handler(error, interaction)
+    elif not interaction.response.is_done():
+        await interaction.response.send_message(f"Error: {str(error)}")
+
+async def _reply_err_message(handler: Optional[Callable], error: Exception, ctx: commands.Context):
+    """
+    Report an error raised by a message command.
+
+    Args:
+        handler: The custom error handler, or None to reply with the error
+        error: The raised exception
+        ctx: The context the command was invoked with
+    """
+    if handler:
+        await handler(error, ctx)
+    else:
+        await ctx.send(f"Error: {str(error)}")
+
+# Kept under its own name so it can be tested against the compiled binder
+_bind_args_py = _bind_args
+
+try:
+    # Compiled binder, see _slash_fast.pyx
+    from _slash_fast import bind_args as _bind_args
+except ImportError:
+    pass
+
+class CommandRecord:
+    """
+    A command registered with a CommandCreator.
+
+    Attributes:
+        name: The name of the command
+        kind: "slash" or "message"
+        description: The command description
+        aliases: List of command aliases
+        func: The command callback
+        sig: The parameters of func, see _extract_params
+        params: Argument descriptors for the help message, see _describe_params
+        help: The memoized help message
+        help_version: Converter registry version the help was built with
+    """
+    __slots__ = ("name", "kind", "description", "aliases", "func", "sig", "help", "params", "help_version")
+
+    def __init__(self, name: str, kind: str, description: Optional[str], aliases: list, func: Callable, sig):
+        self.name = name
+        self.kind = kind
+        self.description = description
+        self.aliases = aliases
+        self.func = func
+        self.sig = sig
+        self.params = _describe_params(sig)
+        self.help = None
+        self.help_version = -1
 
 class CommandCreator:
     def __init__(self, bot):
@@ -14,9 +220,14 @@ class CommandCreator:
         """
         self.bot = bot
         self.tree = app_commands.CommandTree(bot)
-        self.commands = {}
+        self.commands: Dict[str, CommandRecord] = {}
         self.converters: Dict[Type, Callable] = {}
+        self._converters_version = 0
+        # Rebuild the converter list of each command, see _make_invoker
+        self._converter_refreshers: List[Callable] = []
         self.error_handler: Optional[Callable] = None
+        self._sync_pending = False
+        self._sync_task: Optional[asyncio.Task] = None
 
     def register_converter(self, type_: Type, converter: Callable):
         """
@@ -27,6 +238,9 @@ class CommandCreator:
             converter: The conversion function
         """
         self.converters[type_] = converter
+        self._converters_version += 1
+        for refresh in self._converter_refreshers:
+            refresh()
 
     def set_error_handler(self, handler: Callable):
         """
@@ -37,15 +251,118 @@ class CommandCreator:
         """
         self.error_handler = handler
 
-    async def _handle_error(self, error: Exception, ctx: Any):
-        if self.error_handler:
-            await self.error_handler(error, ctx)
+    def schedule_sync(self, delay: float = 0.5):
+        """
+        Schedule a sync of the slash command tree with Discord.
+
+        Calls made within delay seconds of each other are batched into a
+        single tree.sync() request. Must be called from a running event loop.
+
+        Args:
+            delay: Seconds to wait for further registrations before syncing
+        """
+        self._sync_pending = True
+        if self._sync_task is None or self._sync_task.done():
+            self._sync_task = asyncio.get_running_loop().create_task(self._sync_later(delay))
+
+    async def _sync_later(self, delay: float):
+        await asyncio.sleep(delay)
+        while self._sync_pending:
+            # Registrations made while a sync is in flight go out with the next one
+            self._sync_pending = False
+            try:
+                await self.tree.sync()
+            except Exception:
+                # Nothing awaits this task, so report the failure here
+                _log.exception("Failed to sync application commands")
+
+    def _make_invoker(self, func: Callable, spec) -> Callable:
+        """
+        Build a function that binds, converts and forwards the arguments of
+        a command invocation to func.
+
+        The invoker is a plain function returning func's coroutine, so the
+        wrapper awaits the callback directly instead of through an extra
+        coroutine frame.
+
+        Args:
+            func: The command callback
+            spec: The parameters of func, see _extract_params
+
+        Returns:
+            Callable: Function taking (ctx, args, kwargs) and returning the awaitable
+        """
+        # (key, converter) pairs for the parameters that have a converter.
+        # register_converter rebuilds them through the refresh hook, so the
+        # invokers never have to check whether they are stale
+        converters = ()
+        find_converter = self.converters.get
+
+        if isinstance(spec, inspect.Signature):
+            # Positional-only, keyword-only, *args and **kwargs parameters need the full binding rules
+            sig = spec
+            params = list(sig.parameters.values())[1:]  # Skip ctx or interaction
+
+            def refresh_converters():
+                nonlocal converters
+                converters = tuple(
+                    (param.name, param.kind, find_converter(param.annotation))
+                    for param in params if find_converter(param.annotation) is not None
+                )
+            refresh_converters()
+            self._converter_refreshers.append(refresh_converters)
+
+            def invoke(ctx, args, kwargs):
+                bound = sig.bind(ctx, *args, **kwargs)
+                bound.apply_defaults()
+                for name_, kind, converter in converters:
+                    value = bound.arguments[name_]
+                    # The annotation of *args and **kwargs applies to each item
+                    if kind is inspect.Parameter.VAR_POSITIONAL:
+                        value = tuple(converter(item) for item in value)
+                    elif kind is inspect.Parameter.VAR_KEYWORD:
+                        value = {key: converter(item) for key, item in value.items()}
+                    else:
+                        value = converter(value)
+                    bound.arguments[name_] = value
+                return func(*bound.args, **bound.kwargs)
+            return invoke
+
+        names, annotations, defaults, num_required = spec
+        names = names[1:]  # Skip ctx or interaction
+        if not names:
+            # Commands taking only the context need no binding or conversion
+            def invoke(ctx, args, kwargs):
+                if args:
+                    raise TypeError("too many positional arguments")
+                if kwargs:
+                    raise TypeError(f"got an unexpected keyword argument {next(iter(kwargs))!r}")
+                return func(ctx)
+            return invoke
+
+        if num_required:
+            num_required -= 1
         else:
-            if isinstance(ctx, discord.Interaction):
-                if not ctx.response.is_done():
-                    await ctx.response.send_message(f"Error: {str(error)}")
-            else:
-                await ctx.send(f"Error: {str(error)}")
+            defaults = defaults[1:]
+        positions = {name_: index for index, name_ in enumerate(names)}
+        param_annotations = tuple(annotations.get(name_, _EMPTY) for name_ in names)
+        bind_args = _bind_args
+
+        def refresh_converters():
+            nonlocal converters
+            converters = tuple(
+                (index, find_converter(annotation))
+                for index, annotation in enumerate(param_annotations) if find_converter(annotation) is not None
+            )
+        refresh_converters()
+        self._converter_refreshers.append(refresh_converters)
+
+        def invoke(ctx, args, kwargs):
+            final = bind_args(args, kwargs, positions, defaults, num_required)
+            for index, converter in converters:
+                final[index] = converter(final[index])
+            return func(ctx, *final)
+        return invoke
 
     def slash_command(self, name: str, description: str = None):
         """
@@ -59,21 +376,28 @@ class CommandCreator:
             raise ValueError("Description is required for slash commands.")
         
         def decorator(func):
+            spec = _extract_params(func)
+            invoke = self._make_invoker(func, spec)
+            # Build the record before touching the tree, so a failure here
+            # does not leave a half-registered command behind
+            record = CommandRecord(name, "slash", description, [], func, spec)
+            self._build_help(record)
+
             @self.tree.command(name=name, description=description)
             async def wrapper(interaction: discord.Interaction, *args, **kwargs):
                 try:
-                    # Apply custom converters if available
-                    sig = inspect.signature(func)
-                    bound = sig.bind(interaction, *args, **kwargs)
-                    bound.apply_defaults()
-                    for name_, param in sig.parameters.items():
-                        if name_ in self.converters:
-                            value = bound.arguments[name_]
-                            bound.arguments[name_] = self.converters[param.annotation](value)
-                    await func(*bound.args, **bound.kwargs)
+                    await invoke(interaction, args, kwargs)
                 except Exception as e:
-                    await self._handle_error(e, interaction)
-            self.commands[name] = {"type": "slash", "description": description, "func": func}
+                    await _reply_err_interaction(self.error_handler, e, interaction)
+            self.commands[name] = record
+            if self.bot.is_ready():
+                # Commands registered at import time are synced from on_ready instead
+                try:
+                    self.schedule_sync()
+                except RuntimeError:
+                    # No running loop in this thread; the command stays pending
+                    # and goes out with the next schedule_sync call
+                    _log.debug("Deferred sync of %r: no running event loop", name)
             return wrapper
         return decorator
 
@@ -87,21 +411,20 @@ class CommandCreator:
             description: The command description
         """
         def decorator(func):
+            spec = _extract_params(func)
+            invoke = self._make_invoker(func, spec)
+            # Build the record before touching the bot, so a failure here
+            # does not leave a half-registered command behind
+            record = CommandRecord(name, "message", description, aliases or [], func, spec)
+            self._build_help(record)
+
             @self.bot.command(name=name, aliases=aliases or [], description=description)
             async def wrapper(ctx: commands.Context, *args, **kwargs):
                 try:
-                    # Apply custom converters if available
-                    sig = inspect.signature(func)
-                    bound = sig.bind(ctx, *args, **kwargs)
-                    bound.apply_defaults()
-                    for name_, param in sig.parameters.items():
-                        if name_ in self.converters:
-                            value = bound.arguments[name_]
-                            bound.arguments[name_] = self.converters[param.annotation](value)
-                    await func(*bound.args, **bound.kwargs)
+                    await invoke(ctx, args, kwargs)
                 except Exception as e:
-                    await self._handle_error(e, ctx)
-            self.commands[name] = {"type": "message", "aliases": aliases or [], "description": description, "func": func}
+                    await _reply_err_message(self.error_handler, e, ctx)
+            self.commands[name] = record
             return wrapper
         return decorator
 
@@ -119,51 +442,61 @@ class CommandCreator:
             return "Command not found."
 
         command_data = self.commands[command_name]
-        help_message = [f"**{command_name}**"]
-
-        # Add command type and description
-        if command_data["type"] == "slash":
-            help_message.append("Type: Slash Command")
-            if "description" in command_data and command_data["description"]:
-                help_message.append(f"Description: {command_data['description']}")
-        elif command_data["type"] == "message":
-            help_message.append("Type: Message Command")
-            if "description" in command_data and command_data["description"]:
-                help_message.append(f"Description: {command_data['description']}")
-            if "aliases" in command_data and command_data["aliases"]:
-                help_message.append(f"Aliases: {', '.join(command_data['aliases'])}")
+        if command_data.help_version != self._converters_version:
+            # The converter notes may have changed since the help was built
+            self._build_help(command_data)
+        return command_data.help
+
+    def _build_help(self, command_data: CommandRecord):
+        """
+        Build the help message for a command and store it on the command.
+
+        Args:
+            command_data: The command to build help for
+        """
 
         # Add parameter information
-        sig = inspect.signature(command_data["func"])
-        params = sig.parameters
-        if len(params) > 1:  # More than just ctx or interaction
-            help_message.append("\nArguments:")
-            for name, param in params.items():
-                if name in ('self', 'ctx', 'interaction'):
-                    continue
-                
-                # Get parameter type
-                param_type = param.annotation.__name__ if param.annotation != inspect.Parameter.empty else 'Any'
-                
-                # Get default value
-                default = param.default
-                if default == inspect.Parameter.empty:
-                    default_str = "Required"
-                else:
-                    default_str = f"Optional (default: {default})"
-                
-                # Check if there's a custom converter
-                converter_note = ""
-                if param.annotation in self.converters:
-                    converter_note = " (Custom converter available)"
-                
-                help_message.append(
-                    f"- `{name}`: {param_type} ({default_str}){converter_note}"
+        args = ""
+        if command_data.params:
+            args = "\n\nArguments:" + "".join(
+                PARAM_HELP_TMPL.format(
+                    name=name,
+                    type=type_name,
+                    default=default_str,
+                    conv=" (Custom converter available)" if annotation in self.converters else "",
                 )
+                for name, type_name, default_str, annotation in command_data.params
+            )
+
+        # Add command type, description and aliases
+        if command_data.kind == "slash":
+            help_message = SLASH_HELP_TMPL.format(
+                name=command_data.name, desc=command_data.description, args=args
+            )
+        else:
+            description = command_data.description
+            aliases = command_data.aliases
+            help_message = MSG_HELP_TMPL.format(
+                name=command_data.name,
+                desc=f"\nDescription: {description}" if description else "",
+                aliases=f"\nAliases: {', '.join(aliases)}" if aliases else "",
+                args=args,
+            )
 
-        return "\n".join(help_message)
+        command_data.help = help_message
+        command_data.help_version = self._converters_version
 
 if __name__ == '__main__':
+    # Use the faster uvloop/winloop event loop when available
+    try:
+        if platform.system() == "Windows":
+            import winloop as uvloop
+        else:
+            import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
     # Example usage
     intents = discord.Intents.default()
     intents.message_content = True
@@ -193,6 +526,6 @@ if __name__ == '__main__':
     @bot.event
     async def on_ready():
         print(f'Logged in as {bot.user} (ID: {bot.user.id})')
-        await command_creator.tree.sync()
+        command_creator.schedule_sync()
 
     bot.run("YOUR_BOT_TOKEN")
\ No newline at end of file
@@ -0,0 +1,132 @@
+import asyncio
+import inspect
+
+import pytest
+
+discord = pytest.importorskip("discord")
+
+import slash
+from slash import CommandCreator
+
+try:
+    import _slash_fast
+except ImportError:
+    _slash_fast = None
+
+
+def make_creator():
+    return CommandCreator(discord.Client(intents=discord.Intents.none()))
+
+
+def invoke(creator, func, *args, **kwargs):
+    invoker = creator._make_invoker(func, slash._extract_params(func))
+    asyncio.run(invoker(None, args, kwargs))
+
+
+def test_converter_applies_to_each_var_positional_item():
+    creator = make_creator()
+    creator.register_converter(int, int)
+    received = []
+
+    async def command(ctx, *rest: int):
+        received.append(rest)
+
+    invoke(creator, command, "1", "2")
+    assert received == [(1, 2)]
+
+
+def test_converter_applies_to_each_var_keyword_value():
+    creator = make_creator()
+    creator.register_converter(int, int)
+    received = []
+
+    async def command(ctx, **options: int):
+        received.append(options)
+
+    invoke(creator, command, a="1", b="2")
+    assert received == [{"a": 1, "b": 2}]
+
+
+def test_converter_registered_after_command_applies():
+    creator = make_creator()
+    received = []
+
+    async def command(ctx, word: str):
+        received.append(word)
+
+    invoker = creator._make_invoker(command, slash._extract_params(command))
+    asyncio.run(invoker(None, ("hi",), {}))
+    creator.register_converter(str, str.upper)
+    asyncio.run(invoker(None, ("hi",), {}))
+    assert received == ["hi", "HI"]
+
+
+def _all_required(a, b):
+    pass
+
+
+def _some_defaults(a, b, c=3, d=4):
+    pass
+
+
+def _all_defaults(a=1, b=2):
+    pass
+
+
+def _no_params():
+    pass
+
+
+BINDERS = [
+    pytest.param(slash._bind_args_py, id="python"),
+    pytest.param(
+        getattr(_slash_fast, "bind_args", None),
+        id="cython",
+        marks=pytest.mark.skipif(_slash_fast is None, reason="_slash_fast is not built"),
+    ),
+]
+
+BIND_CASES = [
+    (_all_required, (1, 2), {}),
+    (_all_required, (1,), {"b": 2}),
+    (_all_required, (), {"b": 2, "a": 1}),
+    (_all_required, (1,), {}),  # missing
+    (_all_required, (), {"b": 2}),  # missing
+    (_all_required, (1, 2, 3), {}),  # extra
+    (_all_required, (1, 2), {"a": 3}),  # duplicate
+    (_all_required, (1, 2), {"c": 3}),  # unknown keyword
+    (_some_defaults, (1, 2), {}),
+    (_some_defaults, (1, 2, 5), {}),
+    (_some_defaults, (1, 2, 5, 6), {}),
+    (_some_defaults, (1,), {"b": 2, "d": 6}),
+    (_some_defaults, (1, 2, 5, 6, 7), {}),  # extra
+    (_some_defaults, (1, 2, 5), {"c": 5}),  # duplicate
+    (_some_defaults, (), {"c": 5}),  # missing
+    (_all_defaults, (), {}),
+    (_all_defaults, (5,), {}),
+    (_all_defaults, (), {"b": 5}),
+    (_all_defaults, (), {"x": 5}),  # unknown keyword
+    (_no_params, (), {}),
+    (_no_params, (1,), {}),  # extra
+    (_no_params, (), {"a": 1}),  # unknown keyword
+]
+
+
+@pytest.mark.parametrize("binder", BINDERS)
+@pytest.mark.parametrize("func, args, kwargs", BIND_CASES)
+def test_bind_args_matches_signature_bind(binder, func, args, kwargs):
+    try:
+        bound = inspect.signature(func).bind(*args, **kwargs)
+    except TypeError:
+        expected = TypeError
+    else:
+        bound.apply_defaults()
+        expected = list(bound.arguments.values())
+
+    names, _, defaults, num_required = slash._extract_params(func)
+    positions = {name: index for index, name in enumerate(names)}
+    try:
+        result = binder(args, kwargs, positions, defaults, num_required)
+    except TypeError:
+        result = TypeError
+    assert result == expected